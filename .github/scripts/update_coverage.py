@@ -7,6 +7,7 @@
 import argparse
 import json
 import logging
+import re
 from pathlib import Path
 from textwrap import dedent
 
@@ -27,25 +28,30 @@ ALL_OUTPUTS = [README_FILE, DOCS_INDEX_FILE]
 
 # Constants
 BADGE_MARKER = "<!-- coverage-badge -->"
+BADGE_MARKER_RE = re.compile(re.escape(BADGE_MARKER))
+PERCENT_COVERED_RE = re.compile(rb'"percent_covered_display"\s*:\s*"?(\d+)')
+
+
+# Lookup table mapping each percentage 0-100 to its badge color, built once at import
+COLOR_LUT = tuple(
+    "brightgreen" if p >= 90 else
+    "yellow" if p >= 80 else
+    "orange" if p >= 70 else
+    "red"
+    for p in range(101)
+)
 
 
 def determine_coverage_color(coverage_pct: int) -> str:
     """Determine badge color based on coverage percentage.
-    
+
     Args:
-        coverage_pct: Coverage percentage as integer.
-        
+        coverage_pct: Coverage percentage as integer. Clamped to 0-100.
+
     Returns:
         Color name for badge.
     """
-    if coverage_pct >= 90:
-        return "brightgreen"
-    elif coverage_pct >= 80:
-        return "yellow"
-    elif coverage_pct >= 70:
-        return "orange"
-    else:
-        return "red"
+    return COLOR_LUT[max(0, min(100, coverage_pct))]
 
 
 def update_readme_badge(coverage_pct: int, dry_run: bool = False) -> None:
@@ -67,15 +73,24 @@ def update_readme_badge(coverage_pct: int, dry_run: bool = False) -> None:
 
 def update_markdown_file(output_file: Path, badge_md: str, dry_run: bool) -> None:
     markdown_content = output_file.read_text()
-    
+
     first_marker_end, second_marker_start = get_badge_marker_positions(markdown_content, BADGE_MARKER)
-    
-    # Replace content between markers
-    new_readme = (
-        markdown_content[:first_marker_end] +
-        f"    {badge_md}\n" +
-        markdown_content[second_marker_start:]
-    )
+
+    # Skip the rewrite entirely when the badge is already current, so CI runs
+    # with unchanged coverage don't dirty the working tree.
+    existing_badge = markdown_content[first_marker_end:second_marker_start].strip()
+    if existing_badge == badge_md:
+        log.info(f"{output_file.relative_to(PROJECT_ROOT)}: badge already up to date, skipping write")
+        return
+
+    # Replace content between markers.
+    # Single join allocates the final string once instead of building
+    # intermediate concatenation results.
+    new_readme = "".join((
+        markdown_content[:first_marker_end],
+        f"    {badge_md}\n",
+        markdown_content[second_marker_start:],
+    ))
     
     if dry_run:
         log.info(f"DRY RUN: Would update {output_file.relative_to(PROJECT_ROOT)} with badge: {badge_md}")
@@ -95,20 +110,22 @@ def get_badge_marker_positions(content: str, badge_marker: str) -> tuple[int, in
     Raises:
         ValueError: If markers are not found or are in the wrong order.
     """
-    first_marker = content.find(badge_marker)
-    if first_marker == -1:
+    # Locate both markers in a single linear scan instead of separate find() passes
+    marker_re = BADGE_MARKER_RE if badge_marker == BADGE_MARKER else re.compile(re.escape(badge_marker))
+    hits = marker_re.finditer(content)
+    first_hit = next(hits, None)
+    if first_hit is None:
         raise ValueError(f"First badge marker '{badge_marker}' not found.")
-    
-    # Find the end of the first marker line
-    first_marker_end = content.find('\n', first_marker) + 1
-    
-    # Find the second marker starting after the first one
-    second_marker_pos = content.find(badge_marker, first_marker_end)
-    if second_marker_pos == -1:
+
+    second_hit = next(hits, None)
+    if second_hit is None:
         raise ValueError(f"Second marker '{badge_marker}' not found")
-    
-    # Find the start of the second marker line (go back to beginning of line)
-    second_marker_start = content.rfind('\n', 0, second_marker_pos) + 1
+
+    # Find the end of the first marker line
+    first_marker_end = content.find('\n', first_hit.end()) + 1
+
+    # Find the start of the second marker line, scanning back only as far as the first marker
+    second_marker_start = content.rfind('\n', first_hit.end(), second_hit.start()) + 1
 
     return first_marker_end, second_marker_start
 
@@ -124,9 +141,18 @@ def main(dry_run: bool = False) -> None:
         log.error(f"Coverage file not found: {COVERAGE_FILE.relative_to(PROJECT_ROOT)}")
         raise FileNotFoundError(f"Coverage file not found: {COVERAGE_FILE}")
     
-    # Read coverage data
-    coverage_data = json.loads(COVERAGE_FILE.read_text())
-    coverage_pct = int(coverage_data["totals"]["percent_covered_display"])
+    # Read coverage data.
+    # Only one field is needed so scan the raw bytes for it rather than parsing
+    # the whole report (one entry per source file) into a dict. The last match
+    # wins because "totals" is serialised after the per-file entries.
+    coverage_bytes = COVERAGE_FILE.read_bytes()
+    matches = PERCENT_COVERED_RE.findall(coverage_bytes)
+    if matches:
+        coverage_pct = int(matches[-1])
+    else:
+        # Fallback to a full parse if the report layout ever changes
+        coverage_data = json.loads(coverage_bytes)
+        coverage_pct = int(coverage_data["totals"]["percent_covered_display"])
     
     # Update README badge
     update_readme_badge(coverage_pct, dry_run=dry_run)
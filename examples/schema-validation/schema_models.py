@@ -36,7 +36,7 @@ class ConfigModel(BaseModel):
     app: AppConfig
     database: DatabaseConfig
     features: Dict[str, bool] = Field(default_factory=dict, description="Feature flags")
-    
+
     @field_validator('features')
     @classmethod
     def validate_features(cls, v: Dict[str, Any]) -> Dict[str, bool]:
@@ -46,6 +46,19 @@ class ConfigModel(BaseModel):
                 raise ValueError(f"Feature '{key}' must be boolean, got {type(value).__name__}")
         return v
 
+    @classmethod
+    def fast_load(cls, data: Dict[str, Any], skip_validation: bool = False) -> "ConfigModel":
+        """Load a config dict, optionally bypassing validation.
+
+        When the data has already been validated (e.g. an idempotent reload of
+        config that passed --schema checks earlier in the same run),
+        `model_construct` assigns fields directly and skips every field
+        validator, which is substantially cheaper than `model_validate`.
+        """
+        if skip_validation:
+            return cls.model_construct(**data)
+        return cls.model_validate(data)
+
     class Config:
         """Pydantic model configuration."""
         # Allow additional fields not defined in the model
@@ -8,7 +8,8 @@
 #   "types-PyYAML",
 #   "types-jinja2",
 #   "jsonschema",
-#   "pydantic"
+#   "pydantic",
+#   "orjson"
 # ]
 # ///
 # https://docs.astral.sh/uv/guides/scripts/#creating-a-python-script
@@ -17,29 +18,69 @@
 
 # Standard Library
 import argparse
+import concurrent.futures
+import contextlib
+import copy
 import difflib
+import fnmatch
 import functools
+import glob
 import importlib.util
 import itertools
 import json
 import logging
+import mmap
 import os
 import pathlib
-import shlex
+import re
 import sys
 import textwrap
 import tomllib
-from typing import Any, cast
+import types
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, cast
 
 # Third Party
 import jinja2
-import jsonschema
-import pydantic
 import yaml
+
+if TYPE_CHECKING:
+    # Deferred to the schema-validation functions at runtime: together these
+    # imports cost ~100ms, which every --help/plain-templating run would pay.
+    import pydantic
+
+# Third Party
 from deepmerge import always_merger
 from jinja2.filters import FILTERS
 from jinja2.tests import TESTS
 
+try:
+    # libyaml's C scanner/emitter is 5-10x faster than the pure-Python implementations
+    # Third Party
+    from yaml import CSafeDumper as _YamlSafeDumper
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on libyaml availability
+    # Third Party
+    from yaml import SafeDumper as _YamlSafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore[assignment]
+
+try:
+    # Optional accelerator: orjson decodes JSON several times faster than stdlib json
+    # Third Party
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        # OPT_NON_STR_KEYS matches json.dumps, which coerces non-string keys
+        # (YAML/TOML configs can legitimately produce integer keys).
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads  # type: ignore[assignment]
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 log = logging.getLogger(__name__)
 
 
@@ -156,6 +197,9 @@ def __argparse_factory(config: dict[str, Any]) -> argparse.ArgumentParser:
 
         # Handle custom short flags or generate default
         if isinstance(flag_kwargs, dict) and "short_flag" in flag_kwargs:
+            # Shallow-copy just this entry before popping the pseudo-kwarg so the
+            # shared CLI_CONFIG survives repeated main() calls in one process.
+            flag_kwargs = {**flag_kwargs}
             custom_short_flag = flag_kwargs.pop("short_flag")  # Remove from kwargs
             if custom_short_flag:  # If not None/empty, use custom short flag
                 short_flag = custom_short_flag
@@ -188,11 +232,11 @@ def __argparse_factory(config: dict[str, Any]) -> argparse.ArgumentParser:
 
 
 def __handle_args(parser: argparse.ArgumentParser, args: list[str] | None) -> dict[str, Any]:
-    """Handle CLI arguments into structured dictionary output."""
-    script_filename = pathlib.Path(__file__).name
-    # log.info(script_filename)
-    if args is not None and script_filename in args:
-        args.remove(script_filename)
+    """Handle CLI arguments into structured dictionary output.
+
+    Callers own argv hygiene: both `__main__.py` and the `if __name__` block
+    pass `sys.argv[1:]`, so the script filename is already stripped.
+    """
     return vars(parser.parse_args(args))
 
 
@@ -203,20 +247,57 @@ def __handle_args(parser: argparse.ArgumentParser, args: list[str] | None) -> di
 
 def __expand_files_or_globs_list(files_or_globs: list[str]) -> list[str]:
     """Given a list of files or glob patterns, expand them all and return a list of files."""
-    return list(itertools.chain.from_iterable([expand_files_list(x) for x in files_or_globs]))
+    return list(itertools.chain.from_iterable(expand_files_list(x) for x in files_or_globs))
+
 
+_GLOB_CHARS = frozenset("*?[")
 
-def expand_files_list(file_or_glob: str) -> list[str]:
+
+def expand_files_list(file_or_glob: str) -> Iterator[str]:
     """Automatically determine if a string is a file already or a glob pattern and expand it.
-    Always return the resolved list of files."""
-    if pathlib.Path(file_or_glob).is_file():
-        return [file_or_glob]
-    return [str(p) for p in pathlib.Path().glob(file_or_glob)]
+    Lazily yields the resolved files so callers only pay for the matches they consume."""
+    if _GLOB_CHARS.isdisjoint(file_or_glob):
+        # Literal path: a single stat answers it without paying for a glob walk
+        # (os.path.isfile skips the Path allocation on this hot path).
+        if os.path.isfile(file_or_glob):  # noqa: PTH113
+            yield file_or_glob
+        return
+    dirname, basename = os.path.split(file_or_glob)
+    if "**" not in file_or_glob and _GLOB_CHARS.isdisjoint(dirname):
+        # Flat pattern like "conf/*.yml": one scandir call batches the dirents
+        # and d_type answers is_file without a stat per candidate, which glob
+        # pays for on every match.
+        try:
+            with os.scandir(dirname or ".") as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") and not basename.startswith("."):
+                        continue  # glob hides dotfiles unless the pattern asks for them
+                    # is_file() follows symlinks like glob does; d_type still
+                    # answers plain files without a stat.
+                    if fnmatch.fnmatchcase(entry.name, basename) and entry.is_file():
+                        yield entry.path if dirname else entry.name
+        except OSError:
+            pass  # missing/unreadable directory yields nothing, matching glob
+        return
+    # glob.iglob yields plain strings, avoiding a Path allocation per match,
+    # and handles absolute patterns which pathlib.Path().glob does not.
+    yield from glob.iglob(file_or_glob, recursive=True)  # noqa: PTH207
 
 
 def dict_from_keyvalue_list(args: list[str] | None = None) -> dict[str, str] | None:
-    """Convert a list of 'key=value' strings into a dictionary."""
-    return {k: v for k, v in [x.split("=") for x in args]} if args else None
+    """Convert a list of 'key=value' strings into a dictionary.
+
+    Splits on the first '=' only so values may themselves contain '='.
+    Entries without an '=' are skipped.
+    """
+    if not args:
+        return None
+    out: dict[str, str] = {}
+    for arg in args:
+        key, sep, value = arg.partition("=")
+        if sep:
+            out[key] = value
+    return out
 
 
 ########################################################################################
@@ -224,26 +305,14 @@ def dict_from_keyvalue_list(args: list[str] | None = None) -> dict[str, str] | N
 ########################################################################################
 
 
-def __parse_env_line(line: str) -> tuple[str | None, str | None]:
-    """Parses a single line into a key-value pair. Handles quoted values and inline comments.
-
-    Returns (None, None) for invalid lines.
-    """
-    # Guard checks for empty lines or lines without '='
-    line = line.strip()
-    if not line or line.startswith("#") or "=" not in line:
-        return None, None
-
-    # Split the line into key and value at the first '='
-    key, value = line.split("=", 1)
-    key = key.strip()
-
-    # Use shlex to process the value (handles quotes and comments)
-    lexer = shlex.shlex(value, posix=True)
-    lexer.whitespace_split = True  # Tokenize by whitespace
-    value = "".join(lexer)  # Preserve the full quoted/cleaned value
-
-    return key, value
+# One MULTILINE pass over the whole file: group 1 captures the key (not starting
+# with '#', so comment lines never match), group 3 a quoted value kept verbatim
+# with any trailing comment dropped, and group 4 an unquoted value cut at the
+# first inline '#'.
+__ENV_FILE_RE = re.compile(
+    r"""^[ \t]*([^#\s][^=\n]*?)[ \t]*=[ \t]*(?:(["'])(.*?)\2[^\n]*|([^#\n]*))""",
+    re.MULTILINE,
+)
 
 
 def read_env_file(file_path: str) -> dict[str, str] | None:
@@ -270,15 +339,14 @@ def read_env_file(file_path: str) -> dict[str, str] | None:
         None
     """
     file = pathlib.Path(file_path)
-    return (
-        {
-            key: value
-            for key, value in map(__parse_env_line, file.read_text().splitlines())
-            if key is not None and value is not None
-        }
-        if file.is_file()
-        else None
-    )
+    if not file.is_file():
+        return None
+    # A single regex sweep keeps the whole parse inside the C engine instead of
+    # a Python-level loop of strip/partition calls per line.
+    return {
+        match.group(1): match.group(3) if match.group(3) is not None else match.group(4).rstrip()
+        for match in __ENV_FILE_RE.finditer(file.read_text())
+    }
 
 
 ########################################################################################
@@ -291,8 +359,10 @@ def dict_from_prefixes(prefixes: list[str] | None = None) -> dict[str, str] | No
     if not prefixes:
         return None
 
-    env = os.environ
-    return {k.upper(): v for k, v in env.items() for prefix in prefixes if k.lower().startswith(prefix.lower())}
+    # Lowercase the prefixes once, then walk the environment a single time;
+    # str.startswith loops over the prefix tuple in C.
+    lowered_prefixes = tuple(p.lower() for p in prefixes)
+    return {k.upper(): v for k, v in os.environ.items() if k.lower().startswith(lowered_prefixes)}
 
 
 ########################################################################################
@@ -322,10 +392,12 @@ def get_environment_variables(env_flags: list[str], prefixes_list: list[str]) ->
         {'KEY': 'value', 'APP_NAME': 'myapp', ...}
     """
 
-    # Any --env flags that are files are read as .env files
-    env_files = [e for e in env_flags if pathlib.Path(e).is_file()]
-    # The rest are interpretted as KEY=VALUE pairs
-    env_key_values = [e for e in env_flags if e not in env_files]
+    # Partition --env flags in one pass: files are read as .env files,
+    # the rest are interpretted as KEY=VALUE pairs. One stat per entry.
+    env_files: list[str] = []
+    env_key_values: list[str] = []
+    for e in env_flags:
+        (env_files if os.path.isfile(e) else env_key_values).append(e)  # noqa: PTH113 - one stat, no Path object
 
     env = dict_from_keyvalue_list(env_key_values)
     env_from_files = list(filter(None, [read_env_file(e) for e in env_files]))
@@ -337,8 +409,13 @@ def get_environment_variables(env_flags: list[str], prefixes_list: list[str]) ->
     # 3. Environment variables from CLI flags
     envs_by_precedence = [*env_from_files, env_from_prefixes, env]
 
-    # Merge environment variables from all sources
-    return functools.reduce(always_merger.merge, filter(None, envs_by_precedence), {})
+    # Merge environment variables from all sources. Every source is a flat
+    # str -> str dict, so a plain dict.update per source is semantically
+    # identical to a deep merge with later sources overriding earlier ones.
+    merged: dict[str, str] = {}
+    for source in filter(None, envs_by_precedence):
+        merged.update(source)
+    return merged
 
 
 ########################################################################################
@@ -379,33 +456,153 @@ def get_functions(functions: list[str]) -> dict[str, Any]:
 
     functions_dict: dict[str, Any] = {"tests": {}, "filters": {}}
     for f in all_functions:
-        spec = importlib.util.spec_from_file_location("custom_functions", f)
-        log.debug(f"# {spec=}")
-        if spec is not None and spec.loader is not None:
-            module = importlib.util.module_from_spec(spec)
-            log.debug(f"# {module=}")
-            spec.loader.exec_module(module)
-            functions_dict["tests"].update(
-                {
-                    k.removeprefix("test_"): v
-                    for k, v in module.__dict__.items()
-                    if callable(v) and k.startswith("test_")
-                }
-            )
-            functions_dict["filters"].update(
-                {
-                    k.removeprefix("filter_"): v
-                    for k, v in module.__dict__.items()
-                    if callable(v) and k.startswith("filter_")
-                }
-            )
+        module = _load_functions_module(f, pathlib.Path(f).stat().st_mtime_ns)
+        if module is None:
+            continue
+        # Single traversal of the module namespace, classifying by prefix
+        for k, v in module.__dict__.items():
+            if not callable(v):
+                continue
+            if k.startswith("test_"):
+                functions_dict["tests"][k.removeprefix("test_")] = v
+            elif k.startswith("filter_"):
+                functions_dict["filters"][k.removeprefix("filter_")] = v
     return functions_dict
 
 
+@functools.lru_cache(maxsize=128)
+def _load_functions_module(path: str, mtime_ns: int) -> types.ModuleType | None:
+    """Import a custom-functions file, cached by (path, mtime).
+
+    Repeated merge() calls skip the compile+exec of unchanged function files.
+    """
+    spec = importlib.util.spec_from_file_location("custom_functions", path)
+    log.debug("# spec=%r", spec)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    log.debug("# module=%r", module)
+    spec.loader.exec_module(module)
+    return module
+
+
 ########################################################################################
 # Configuration files and Jinja Templating
 ########################################################################################
 
+# Shared Jinja2 Environment so compiled templates are cached per process instead of
+# re-creating a throwaway Environment (and re-parsing the source) on every render.
+# The bytecode cache additionally persists compiled templates across CLI invocations
+# so warm runs (eg CI loops re-rendering the same template) skip parse/compile too.
+# NOTE: Providing jinja 2.11.x compatable version to better cross operate
+# with dbt-databricks v1.2.2 and down stream dbt-spark and dbt-core
+_JINJA_MAJOR_VERSION = int(jinja2.__version__.split(".", 1)[0])  # type: ignore
+
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader("/"),
+    undefined=jinja2.StrictUndefined,
+    autoescape=False,
+    cache_size=400,
+    auto_reload=True,
+)
+
+_bytecode_cache_attached = False
+
+
+def _attach_bytecode_cache() -> None:
+    """Attach the persistent bytecode cache to the shared Environment on first use.
+
+    FileSystemBytecodeCache's default directory is per-user (mode 0700 with an
+    ownership check), so cache entries cannot be planted by other users on a
+    shared host. Deferring creation here keeps module import free of filesystem
+    writes; if the temp dir is unusable we just skip persistent caching.
+    """
+    global _bytecode_cache_attached
+    _bytecode_cache_attached = True
+    with contextlib.suppress(OSError, RuntimeError):  # unusable/unsafe temp dir
+        _JINJA_ENV.bytecode_cache = jinja2.FileSystemBytecodeCache()
+
+
+def _get_template(template_filename: str) -> jinja2.Template:
+    """Fetch the compiled template for a file via the shared Environment.
+
+    `get_template` returns the cached compiled template (mtime-checked) when
+    the file is unchanged, so repeated renders skip lex/parse/compile.
+    """
+    if not _bytecode_cache_attached:
+        _attach_bytecode_cache()
+    if _JINJA_MAJOR_VERSION >= 3:
+        return _JINJA_ENV.get_template(str(pathlib.Path(template_filename).resolve()))
+    return _compile_template_legacy(  # pragma: no cover - only reachable on jinja2 2.x
+        template_filename, pathlib.Path(template_filename).stat().st_mtime_ns
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template_legacy(template_filename: str, mtime_ns: int) -> jinja2.Template:  # pragma: no cover
+    """Compile a template once per (path, mtime) on the Jinja 2.x fallback path."""
+    return jinja2.Template(_read_text_cached(template_filename, mtime_ns))
+
+
+@functools.lru_cache(maxsize=256)
+def _read_text_cached(filename: str, mtime_ns: int) -> str:
+    """Read file content, cached by (path, mtime) so unchanged files hit disk once.
+
+    Reads raw bytes and decodes explicitly, skipping the text-mode layer's
+    universal-newline translation pass; the downstream parsers all handle
+    CRLF themselves.
+    """
+    return pathlib.Path(filename).read_bytes().decode("utf-8")
+
+
+def _read_template_text(template_filename: str) -> str:
+    """Read template/config file content via the mtime-keyed cache."""
+    return _read_text_cached(template_filename, pathlib.Path(template_filename).stat().st_mtime_ns)
+
+
+# Files above this size are memory-mapped instead of read into a bytes object
+_MMAP_THRESHOLD_BYTES = 1 << 20
+
+
+def _read_config_buffer(filename: str) -> Any:
+    """Read a config file as bytes, memory-mapping large files.
+
+    For files over 1 MiB an mmap lets the OS page data in on demand and
+    skips one full-buffer copy; smaller files aren't worth the fixed mmap
+    setup cost. The returned object is consumed by parsers that accept a
+    readable buffer (YAML).
+    """
+    with pathlib.Path(filename).open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > _MMAP_THRESHOLD_BYTES:
+            return mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        return f.read()
+
+
+def _parse_yaml(content: str | bytes) -> Any:
+    return yaml.load(content, Loader=_YamlSafeLoader)
+
+
+def _parse_toml(content: str | bytes) -> Any:
+    return tomllib.loads(content if isinstance(content, str) else content.decode("utf-8"))
+
+
+# Suffix -> parser dispatch; each parser accepts the templated string or the raw file bytes.
+_CONFIG_PARSERS: dict[str, Callable[[str | bytes], Any]] = {
+    ".json": _json_loads,
+    ".yml": _parse_yaml,
+    ".yaml": _parse_yaml,
+    ".toml": _parse_toml,
+}
+
+# --stdin-format choices map onto the same parsers
+_STDIN_PARSERS: dict[str, Callable[[str | bytes], Any]] = {
+    "json": _json_loads,
+    "yml": _parse_yaml,
+    "yaml": _parse_yaml,
+    "toml": _parse_toml,
+}
+
 
 def load_config(filename: str, environment_variables: dict[str, str] | None = None) -> Any:
     """Load and parse a configuration file, optionally templating it with environment variables.
@@ -437,30 +634,77 @@ def load_config(filename: str, environment_variables: dict[str, str] | None = No
         >>> load_config("config.yaml", {"ENV": "production"})
         {'environment': 'production', 'debug': False}
     """
+    env_items = tuple(sorted(environment_variables.items())) if environment_variables else None
+    return _load_config_keyed(filename, environment_variables, env_items)
+
+
+def _load_config_keyed(
+    filename: str,
+    environment_variables: dict[str, str] | None,
+    env_items: tuple[tuple[str, str], ...] | None,
+) -> Any:
+    """load_config with the env cache key precomputed by the caller.
+
+    Lets merge() fingerprint the environment once per run instead of
+    re-sorting the same dict for every config file.
+    """
+    try:
+        stat_result = os.stat(filename)  # noqa: PTH116 - called per config file; skips the Path allocation
+        parsed = _load_config_cached(filename, stat_result.st_mtime_ns, stat_result.st_size, env_items)
+    except (TypeError, OSError):
+        # Unhashable environment values cannot key the cache, and stat failures
+        # defer to the parse path so it raises its usual errors for the caller.
+        return _parse_config_file(filename, environment_variables)
+    # A deep copy insulates the cached value from mutation by callers (the
+    # merge pipeline mutates accumulators in place).
+    return copy.deepcopy(parsed)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_config_cached(
+    filename: str, mtime_ns: int, size: int, env_items: tuple[tuple[str, str], ...] | None
+) -> Any:
+    """Parse ``filename``, memoised per file identity and templating environment.
+
+    The key deliberately omits the registered custom Jinja filters/tests, so
+    merge() clears this cache whenever it registers new functions to avoid
+    serving a parse templated with a different function set.
+    """
+    return _parse_config_file(filename, dict(env_items) if env_items else None)
+
+
+def _parse_config_file(filename: str, environment_variables: dict[str, str] | None) -> Any:
+    """Read, optionally template, and parse ``filename`` (the cache-miss path)."""
+    suffix = pathlib.PurePath(filename).suffix.lower()
+    parser = _CONFIG_PARSERS.get(suffix)
+    if parser is None:
+        raise ValueError(f"File type of {filename} not supported.")
+
+    # Fast path: with no environment variables there is no templating pass, so
+    # parse straight from the file bytes and skip the intermediate decoded string.
+    if not environment_variables:
+        if suffix == ".toml":
+            with pathlib.Path(filename).open("rb") as f:
+                return tomllib.load(f)
+        if suffix in (".yml", ".yaml"):
+            # The YAML loader accepts a readable buffer, so large files can be mmap'd
+            return parser(_read_config_buffer(filename))
+        return parser(pathlib.Path(filename).read_bytes())
+
     # Step 1 & 2: Get raw template string and merge config (as necessary), returning as string
     content = merge_template(filename, environment_variables)
 
     # Step 3: Parse populated string into a data structure.
-    if filename.lower().endswith("json"):
-        return json.loads(content)
-    elif any([filename.lower().endswith(ext) for ext in ["yml", "yaml"]]):
-        return yaml.safe_load(content)
-    elif filename.lower().endswith("toml"):
-        return tomllib.loads(content)
-
-    raise ValueError(f"File type of {filename} not supported.")  # pragma: no cover
+    return parser(content)
 
 
-def parse_stdin_content(content: str, format_type: str) -> Any:
+def parse_stdin_content(content: str | bytes, format_type: str) -> Any:
     """Helper function to parse stdin content based on format."""
-    if format_type == "json":
-        return json.loads(content)
-    elif format_type in ("yaml", "yml"):
-        return yaml.safe_load(content)
-    elif format_type == "toml":
-        return tomllib.loads(content)
-    # This case should ideally be caught by argparse choices, but as a fallback:
-    raise ValueError(f"Unsupported stdin format: {format_type}")
+    parser = _STDIN_PARSERS.get(format_type)
+    if parser is None:
+        # This case should ideally be caught by argparse choices, but as a fallback:
+        raise ValueError(f"Unsupported stdin format: {format_type}")
+    return parser(content)
 
 
 def merge_template(template_filename: str, config: dict[str, Any] | None) -> str:
@@ -495,24 +739,22 @@ def merge_template(template_filename: str, config: dict[str, Any] | None) -> str
         >>> merge_template("static.txt", None)
         'This is static content'
     """
-    # Step 1: get raw content as a string
-    raw_content = pathlib.Path(template_filename).read_text()
-
-    # Step 2: Treat raw_content as a Jinja2 template if providing configuration
+    # Treat the file as a Jinja2 template if providing configuration,
+    # otherwise return its raw content unchanged.
     if config:
-        # NOTE: Providing jinja 2.11.x compatable version to better cross operate
-        # with dbt-databricks v1.2.2 and down stream dbt-spark and dbt-core
+        # A cheap tag scan dodges the whole compile+render cycle for files
+        # that contain no Jinja syntax at all.
+        raw_content = _read_template_text(template_filename)
+        if "{{" not in raw_content and "{%" not in raw_content and "{#" not in raw_content:
+            return raw_content
         try:
-            if int(jinja2.__version__[0]) >= 3:  # type: ignore
-                content = jinja2.Template(raw_content, undefined=jinja2.StrictUndefined).render(**config)
-            else:
-                content = jinja2.Template(raw_content).render(**config)
+            content = _get_template(template_filename).render(**config)
         except jinja2.exceptions.UndefinedError as e:
             log.error(f"{template_filename} UndefinedError: {e}")
             raise
 
     else:
-        content = raw_content
+        content = _read_template_text(template_filename)
 
     return content
 
@@ -544,11 +786,28 @@ def map_env_to_confs(config_files_or_globs: list[str], env: dict[str, Any]) -> l
         >>> map_env_to_confs(["config/*.yaml"], {"ENV": "prod"})
         [{'database': 'prod_db'}, {'cache': 'redis_prod'}]
     """
-    log.debug(f"# config sources: {config_files_or_globs=}")
+    return list(_iter_env_to_confs(config_files_or_globs, env))
+
+
+def _iter_env_to_confs(config_files_or_globs: list[str], env: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield parsed config dicts one at a time, in input order.
+
+    Generator form of map_env_to_confs so callers can merge each config as it
+    arrives instead of holding every parsed dict in memory simultaneously.
+    """
+    log.debug("# config sources: config_files_or_globs=%r", config_files_or_globs)
     all_conf_files = __expand_files_or_globs_list(config_files_or_globs)
-    log.debug(f"# all_conf_files: {all_conf_files=}")
-    confs = [load_config(conf, env) for conf in all_conf_files]
-    return confs
+    log.debug("# all_conf_files: all_conf_files=%r", all_conf_files)
+    # Fingerprint the environment once for the whole run; every file shares it,
+    # so per-file cache lookups skip re-sorting the same dict.
+    env_items = tuple(sorted(env.items())) if env else None
+    if len(all_conf_files) > 1:
+        # Each load is disk read + render + parse, so fan out across threads.
+        # Executor.map preserves input order, which the later merge relies on.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(all_conf_files))) as executor:
+            yield from executor.map(lambda conf: _load_config_keyed(conf, env, env_items), all_conf_files)
+    elif all_conf_files:
+        yield _load_config_keyed(all_conf_files[0], env, env_items)
 
 
 def reduce_confs(confs: list[dict[str, Any]]) -> dict[str, Any]:
@@ -577,7 +836,45 @@ def reduce_confs(confs: list[dict[str, Any]]) -> dict[str, Any]:
         >>> reduce_confs([base, override])
         {'db': {'host': 'prod.example.com', 'port': 5432}}
     """
-    return functools.reduce(always_merger.merge, confs, {})
+    return functools.reduce(_fast_merge, confs, {})
+
+
+def _fast_merge(dst: Any, src: Any) -> Any:
+    """Deep merge ``src`` into ``dst`` in place.
+
+    Mirrors deepmerge.always_merger semantics (dicts merge recursively, lists
+    append, scalars override) but fast-paths the dominant dict+dict and
+    list+list cases without deepmerge's per-node strategy lookup. Any other
+    type pairing defers to always_merger to keep behaviour identical.
+    """
+    if type(dst) is not dict or type(src) is not dict:
+        # Non-dict top levels (None from an empty YAML file, list documents,
+        # scalars) keep deepmerge's strategies: lists append, mismatches override.
+        return always_merger.merge(dst, src)
+    if not dst:
+        # First merge into an empty accumulator is a plain copy of keys
+        dst.update(src)
+        return dst
+    for key, value in src.items():
+        if key in dst:
+            existing = dst[key]
+            if existing is value:
+                continue  # merging an object into itself is a no-op
+            # Exact-type checks beat isinstance here; subclass pairings fall
+            # through to always_merger which applies the same strategies.
+            if type(existing) is dict and type(value) is dict:
+                if value:
+                    _fast_merge(existing, value)
+            elif type(existing) is list and type(value) is list:
+                existing.extend(value)
+            else:
+                dst[key] = always_merger.merge(existing, value)
+        else:
+            # Interning shares one key object across the many configs that
+            # repeat the same field names, so later lookups short-circuit on
+            # identity instead of comparing characters.
+            dst[sys.intern(key) if type(key) is str else key] = value
+    return dst
 
 
 ########################################################################################
@@ -585,7 +882,7 @@ def reduce_confs(confs: list[dict[str, Any]]) -> dict[str, Any]:
 ########################################################################################
 
 
-def _load_pydantic_model(schema_spec: str) -> type[pydantic.BaseModel]:
+def _load_pydantic_model(schema_spec: str) -> "type[pydantic.BaseModel]":
     """Load a Pydantic model from a module specification.
 
     Args:
@@ -609,13 +906,34 @@ def _load_pydantic_model(schema_spec: str) -> type[pydantic.BaseModel]:
     if not module_file.exists():
         raise PydanticConfigSchemaLoadingError(f"Pydantic validation failed: Module file '{module_path}' not found.")
 
-    # Import the module dynamically
-    spec = importlib.util.spec_from_file_location("schema_module", module_file)
+    # Keyed by mtime so repeat validations against the same schema module skip
+    # the importlib exec, while edits to the file still invalidate the entry.
+    return _load_pydantic_model_cached(module_path, class_name, module_file.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_pydantic_model_cached(module_path: str, class_name: str, mtime_ns: int) -> "type[pydantic.BaseModel]":
+    """Import ``module_path`` and return its ``class_name`` Pydantic model."""
+    # Third Party
+    import pydantic
+
+    module_file = pathlib.Path(module_path)
+
+    # Import the module dynamically under a name unique to this file+mtime so
+    # sys.modules registration (needed for dataclass/pickle resolution inside
+    # user models) never collides between different schema modules.
+    module_name = f"injinja_schema_{abs(hash((module_path, mtime_ns)))}"
+    spec = importlib.util.spec_from_file_location(module_name, module_file)
     if spec is None or spec.loader is None:
         raise PydanticConfigSchemaLoadingError(f"Pydantic validation failed: Could not load module '{module_path}'")
 
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
 
     # Get the model class
     if not hasattr(module, class_name):
@@ -654,12 +972,15 @@ def validate_config_with_pydantic(config: dict[str, Any], schema_spec: str) -> N
     Raises:
         ConfigSchemaValidationError: If validation fails with detailed error message
     """
+    # Third Party
+    import pydantic
+
     try:
         model_class = _load_pydantic_model(schema_spec)
 
         # Validate the configuration
         model_class.model_validate(config)
-        log.debug(f"✅ Configuration successfully validated against Pydantic model '{schema_spec}'")
+        log.debug("✅ Configuration successfully validated against Pydantic model '%s'", schema_spec)
 
     except pydantic.ValidationError as e:
         # Unpack Pydantic validation errors for better formatted output.
@@ -691,15 +1012,26 @@ def _load_json_schema(schema_file: str) -> dict[str, Any]:
     if not schema_path.exists():
         raise JSONSchemaLoadingError(f"Schema validation failed: Schema file '{schema_file}' not found.")
 
+    # Keyed by mtime so repeat validations reuse the parsed schema dict while
+    # edits to the file still invalidate the entry.
+    return _load_json_schema_cached(schema_file, schema_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_schema_cached(schema_file: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse ``schema_file`` as a JSON Schema dictionary."""
+    schema_path = pathlib.Path(schema_file)
+
     # Parse schema file (support JSON only for JSON Schema spec compliance)
     try:
         if schema_file.lower().endswith(".json"):
-            return cast("dict[str, Any]", json.loads(schema_path.read_text()))
+            # _json_loads takes the raw bytes so orjson can skip a decode pass
+            return cast("dict[str, Any]", _json_loads(schema_path.read_bytes()))
         else:
             raise JSONSchemaLoadingError(
                 f"Schema validation failed: JSON Schema must be a .json file, got: {schema_file}"
             )
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # both orjson and stdlib json raise ValueError subclasses
         raise JSONSchemaLoadingError(
             f"Schema validation failed: Invalid JSON in schema file '{schema_file}': {e}"
         ) from e
@@ -707,6 +1039,18 @@ def _load_json_schema(schema_file: str) -> dict[str, Any]:
         raise JSONSchemaLoadingError(f"Schema validation failed: Error reading schema file '{schema_file}': {e}") from e
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_json_schema_validator(schema_file: str, mtime_ns: int) -> Any:
+    """Compile ``schema_file`` into a reusable jsonschema validator instance."""
+    # Third Party
+    import jsonschema
+
+    schema = _load_json_schema_cached(schema_file, mtime_ns)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def validate_config_with_jsonschema(config: dict[str, Any], schema_file: str) -> None:
     """Validate the final merged configuration against a JSON Schema.
 
@@ -717,12 +1061,20 @@ def validate_config_with_jsonschema(config: dict[str, Any], schema_file: str) ->
     Raises:
         ConfigValidationError: If validation fails with detailed error message
     """
+    # Third Party
+    import jsonschema
+
     try:
-        schema = _load_json_schema(schema_file)
+        # Surfaces not-found/unreadable schemas as JSONSchemaLoadingError before
+        # the stat below; the parsed dict itself comes from the same cache slot.
+        _load_json_schema(schema_file)
 
-        # Validate the configuration
-        jsonschema.validate(instance=config, schema=schema)
-        log.debug(f"✅ Configuration successfully validated against schema '{schema_file}'")
+        # Validate the configuration with a pre-compiled validator.
+        # jsonschema.validate() re-checks the schema and rebuilds the validator
+        # on every call; compiling once per (path, mtime) amortises that away.
+        validator = _compile_json_schema_validator(schema_file, pathlib.Path(schema_file).stat().st_mtime_ns)
+        validator.validate(config)
+        log.debug("✅ Configuration successfully validated against schema '%s'", schema_file)
 
     except jsonschema.ValidationError as e:
         error_details = ["Schema validation failed:"]
@@ -783,14 +1135,22 @@ def validate_config_with_schema(config: dict[str, Any], schema: str) -> None:
 def _process_stdin_config(stdin_format: str | None, confs: list[dict[str, Any]]) -> None:
     """Process configuration from stdin if provided."""
     if stdin_format and not sys.stdin.isatty():
-        log.debug(f"# Reading config from stdin with format: {stdin_format}")
-        stdin_content = sys.stdin.read()
+        log.debug("# Reading config from stdin with format: %s", stdin_format)
+        # Prefer the raw byte stream: every stdin parser accepts bytes, which
+        # skips a Python-level UTF-8 decode of the whole payload. Mocked or
+        # wrapped stdins whose buffer does not yield bytes fall back to text.
+        buffer = getattr(sys.stdin, "buffer", None)
+        stdin_content: str | bytes = buffer.read() if buffer is not None else sys.stdin.read()
+        if not isinstance(stdin_content, str | bytes):
+            stdin_content = sys.stdin.read()
         if stdin_content.strip():  # Ensure content is not just whitespace
             try:
                 stdin_conf = parse_stdin_content(stdin_content, stdin_format)
                 if stdin_conf is not None:  # Check if parsing resulted in a valid (non-None) config
                     confs.append(stdin_conf)  # Add to the list of configs to be merged
-                    log.debug(f"# Config from stdin: {json.dumps(stdin_conf, indent=2) if DEBUG_MODE else 'loaded'}")
+                    # Only serialise the config when debug logging is active.
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(f"# Config from stdin: {json.dumps(stdin_conf, indent=2) if DEBUG_MODE else 'loaded'}")
                 else:
                     log.debug("# stdin content parsed to None, not adding.")
             except Exception as e:
@@ -799,7 +1159,43 @@ def _process_stdin_config(stdin_format: str | None, confs: list[dict[str, Any]])
         else:  # pragma: no cover
             log.debug("# stdin was empty or whitespace only, no config read.")
     elif stdin_format and sys.stdin.isatty():  # pragma: no cover
-        log.debug(f"# --stdin-format '{stdin_format}' provided, but no data piped to stdin.")
+        log.debug("# --stdin-format '%s' provided, but no data piped to stdin.", stdin_format)
+
+
+def _emit_config_json(final_conf: dict[str, Any], merged_template: str) -> None:
+    """Emit the merged config as JSON on stdout."""
+    # Serialise straight to the byte stream: skips building a Python string
+    # and re-encoding it through the text layer. Replaced stdouts without a
+    # real buffer (e.g. StringIO) fall back to print.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        sys.stdout.flush()
+        buffer.write(_json_dumps_bytes(final_conf))
+        buffer.write(b"\n")
+        buffer.flush()
+    else:  # pragma: no cover - depends on how stdout was replaced
+        print(_json_dumps_bytes(final_conf).decode())
+
+
+def _emit_config_yaml(final_conf: dict[str, Any], merged_template: str) -> None:
+    """Emit the merged config as YAML on stdout."""
+    # Stream the document as the dumper emits it rather than buffering the
+    # whole serialised string first.
+    yaml.dump(final_conf, sys.stdout, Dumper=_YamlSafeDumper, indent=2)
+
+
+def _emit_template(final_conf: dict[str, Any], merged_template: str) -> None:
+    """Emit the rendered template on stdout."""
+    print(merged_template)
+
+
+# Sentinel output modes -> emitters; anything else is treated as a file path.
+_OUTPUT_HANDLERS: dict[str, Callable[[dict[str, Any], str], None]] = {
+    "config-json": _emit_config_json,
+    "config-yaml": _emit_config_yaml,
+    "config-yml": _emit_config_yaml,
+    "stdout": _emit_template,
+}
 
 
 def _write_output(output: str, final_conf: dict[str, Any], merged_template: str) -> None:
@@ -807,15 +1203,15 @@ def _write_output(output: str, final_conf: dict[str, Any], merged_template: str)
 
     Default is stdout, but can be a file path.
     """
-    if output == "config-json":
-        print(json.dumps(final_conf, indent=2))
-    elif output in ("config-yaml", "config-yml"):
-        print(yaml.dump(final_conf, indent=2))
-    elif output == "stdout":
-        print(merged_template)
+    handler = _OUTPUT_HANDLERS.get(output)
+    if handler is not None:
+        handler(final_conf, merged_template)
     else:
-        pathlib.Path(output).parent.mkdir(parents=True, exist_ok=True)
-        pathlib.Path(output).write_text(merged_template)
+        output_path = pathlib.Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Encode once and write the bytes in a single call, skipping the text
+        # layer's incremental encode and newline translation.
+        output_path.write_bytes(merged_template.encode("utf-8"))
 
 
 ########################################################################################
@@ -891,21 +1287,39 @@ def merge(
     merged_env: dict[str, str] = get_environment_variables(env_flags=_env, prefixes_list=_prefix)
 
     # Custom functions
-    log.debug(f"# functions {_functions=}")
+    log.debug("# functions _functions=%r", _functions)
     f = get_functions(_functions)
     # Update Jinja2 global environment settings with the custom functions
     TESTS.update(f["tests"])
     FILTERS.update(f["filters"])
-
-    # Static configuration
-    confs = map_env_to_confs(config_files_or_globs=_config, env=merged_env)
-    log.debug(f"# confs: {json.dumps(confs, indent=2)}")
+    # The shared Environment copied the global FILTERS/TESTS at import time so it
+    # needs the custom functions registered explicitly too.
+    _JINJA_ENV.tests.update(f["tests"])
+    _JINJA_ENV.filters.update(f["filters"])
+    if f["tests"] or f["filters"]:
+        # Cached config parses were templated against the previous function
+        # set; registering new filters/tests invalidates them.
+        _load_config_cached.cache_clear()
+
+    # Static configuration — stream each parsed config straight into the
+    # accumulating merge so peak memory holds one config plus the merged result
+    # rather than every parsed config simultaneously.
+    final_conf: dict[str, Any] = {}
+    for conf in _iter_env_to_confs(_config, merged_env):
+        if conf is None:
+            continue  # empty config files parse to None; nothing to merge
+        final_conf = _fast_merge(final_conf, conf)
 
     # Process stdin configuration if provided
-    _process_stdin_config(stdin_format, confs)
+    stdin_confs: list[dict[str, Any]] = []
+    _process_stdin_config(stdin_format, stdin_confs)
+    for conf in stdin_confs:
+        # Non-dict payloads (eg a top-level JSON array) rebind the accumulator
+        # via always_merger, matching the old reduce_confs behaviour.
+        final_conf = _fast_merge(final_conf, conf)
 
-    final_conf = reduce_confs(confs)
-    log.debug(f"# reduced confs: {json.dumps(final_conf, indent=2)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(f"# reduced confs: {json.dumps(final_conf, indent=2)}")
 
     # Validate final configuration against schema if provided
     # Raise errors if invalid to break flow before templating
@@ -913,14 +1327,24 @@ def merge(
         validate_config_with_schema(final_conf, schema)
 
     merged_template = merge_template(template, final_conf) if template else ""
-    log.debug(f"# merged_template: {merged_template=}")
+    log.debug("# merged_template: merged_template=%r", merged_template)
 
-    # Validation diff if requested
+    # Validation diff if requested.
+    # The diff itself is part of this function's return contract so it is always
+    # computed when validate is set, but only logged when DEBUG is live.
     diff = None
     if validate:
         validator_text = pathlib.Path(validate).read_text()
-        diff = "\n".join(difflib.unified_diff(merged_template.splitlines(), validator_text.splitlines(), lineterm=""))
-        log.debug(diff)
+        if merged_template == validator_text:
+            # Identical output is the happy path: a C-level string compare
+            # replaces the O(N*M) diff walk that would produce "" anyway.
+            diff = ""
+        else:
+            diff = "\n".join(
+                difflib.unified_diff(merged_template.splitlines(), validator_text.splitlines(), lineterm="")
+            )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(diff)
 
     # Write output in the requested format
     _write_output(output, final_conf, merged_template)
@@ -0,0 +1,59 @@
+"""Shared fixtures for the injinja test suite."""
+
+# Standard Library
+import json
+
+# Third Party
+import pytest
+from jinja2.filters import FILTERS
+from jinja2.tests import TESTS
+
+# Our Libraries
+from injinja.injinja import _JINJA_ENV
+
+# Pre-dedented so the fixtures write the payloads verbatim
+CONFIG_MODEL_SRC = (
+    "from pydantic import BaseModel\n"
+    "\n"
+    "class ConfigModel(BaseModel):\n"
+    "    database_url: str\n"
+    "    port: int\n"
+    "    debug: bool = False\n"
+)
+
+NAME_AGE_SCHEMA = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
+    "required": ["name", "age"],
+}
+
+
+@pytest.fixture(autouse=True)
+def isolate_jinja_registries():
+    """Snapshot and restore Jinja's filter/test registries around each test.
+
+    merge() registers custom functions onto the shared environment (and the
+    legacy global FILTERS/TESTS dicts), so tests that load functions would
+    otherwise leak filters into later tests and make results order-dependent.
+    """
+    snapshots = [(registry, dict(registry)) for registry in (FILTERS, TESTS, _JINJA_ENV.filters, _JINJA_ENV.tests)]
+    yield
+    for registry, snapshot in snapshots:
+        registry.clear()
+        registry.update(snapshot)
+
+
+@pytest.fixture(scope="session")
+def pydantic_model_file(tmp_path_factory):
+    """ConfigModel schema module written to disk once for the whole session."""
+    path = tmp_path_factory.mktemp("schemas") / "test_models.py"
+    path.write_text(CONFIG_MODEL_SRC)
+    return path
+
+
+@pytest.fixture(scope="session")
+def json_schema_file(tmp_path_factory):
+    """name/age JSON Schema file written to disk once for the whole session."""
+    path = tmp_path_factory.mktemp("schemas") / "test_schema.json"
+    path.write_text(json.dumps(NAME_AGE_SCHEMA))
+    return path
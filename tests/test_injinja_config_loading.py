@@ -42,6 +42,32 @@ class TestConfigLoading:
         result = load_config(str(json_file), {"var": "templated_value"})
         assert result == {"key": "templated_value"}
 
+    def test_load_config_yaml_with_template(self, tmp_path):
+        """Test load_config templates YAML files with environment variables."""
+        yaml_file = tmp_path / "config.yml"
+        yaml_file.write_text("key: {{ var }}")
+
+        result = load_config(str(yaml_file), {"var": "templated_value"})
+        assert result == {"key": "templated_value"}
+
+    def test_load_config_toml_with_template(self, tmp_path):
+        """Test load_config templates TOML files with environment variables."""
+        toml_file = tmp_path / "config.toml"
+        toml_file.write_text('key = "{{ var }}"')
+
+        result = load_config(str(toml_file), {"var": "templated_value"})
+        assert result == {"key": "templated_value"}
+
+    def test_load_config_returns_fresh_copy(self, tmp_path):
+        """Test cached load_config results are safe for callers to mutate."""
+        json_file = tmp_path / "config.json"
+        json_file.write_text('{"key": {"nested": "value"}}')
+
+        first = load_config(str(json_file))
+        first["key"]["nested"] = "mutated"
+
+        assert load_config(str(json_file)) == {"key": {"nested": "value"}}
+
     def test_load_config_unsupported(self, tmp_path):
         """Test load_config raises error for unsupported file type."""
         txt_file = tmp_path / "config.txt"
@@ -1,7 +1,7 @@
 """Tests for configuration merging functions."""
 
 # Our Libraries
-from injinja.injinja import map_env_to_confs, reduce_confs
+from injinja.injinja import map_env_to_confs, merge, reduce_confs
 
 
 class TestConfigMerging:
@@ -15,6 +15,16 @@ class TestConfigMerging:
         result = map_env_to_confs([str(config_file)], {"env_var": "value"})
         assert result == [{"key": "value"}]
 
+    def test_map_env_to_confs_multiple_files(self, tmp_path):
+        """Test map_env_to_confs preserves input order across multiple files."""
+        config_1 = tmp_path / "config_1.json"
+        config_1.write_text('{"first": "{{ env_var }}"}')
+        config_2 = tmp_path / "config_2.json"
+        config_2.write_text('{"second": "{{ env_var }}"}')
+
+        result = map_env_to_confs([str(config_1), str(config_2)], {"env_var": "value"})
+        assert result == [{"first": "value"}, {"second": "value"}]
+
     def test_reduce_confs(self):
         """Test reduce_confs merges configurations."""
         confs = [{"key1": "value1", "shared": "first"}, {"key2": "value2", "shared": "second"}]
@@ -23,3 +33,38 @@ class TestConfigMerging:
         assert result["key1"] == "value1"
         assert result["key2"] == "value2"
         assert result["shared"] == "second"  # Later configs override
+
+    def test_reduce_confs_deep_merge(self):
+        """Test reduce_confs recursively merges dicts and appends lists."""
+        confs = [
+            {"db": {"host": "localhost", "port": 5432}, "tags": ["base"]},
+            {"db": {"host": "prod.example.com"}, "tags": ["prod"], "extra": 1},
+        ]
+
+        result = reduce_confs(confs)
+        assert result["db"] == {"host": "prod.example.com", "port": 5432}
+        assert result["tags"] == ["base", "prod"]
+        assert result["extra"] == 1
+
+    def test_reduce_confs_mixed_type_override(self):
+        """Test reduce_confs lets later configs override with a different type."""
+        confs = [{"key": ["list"]}, {"key": "scalar"}]
+
+        result = reduce_confs(confs)
+        assert result["key"] == "scalar"
+
+    def test_merge_skips_empty_config_file(self, tmp_path):
+        """Test merge ignores empty config files that parse to None."""
+        empty_file = tmp_path / "empty.yml"
+        empty_file.write_text("")
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("key: value")
+        template_file = tmp_path / "template.txt"
+        template_file.write_text("{{ key }}")
+
+        result, _ = merge(config=[str(empty_file), str(config_file)], template=str(template_file))
+        assert result == "value"
+
+    def test_reduce_confs_top_level_list(self):
+        """Test reduce_confs defers non-dict top levels to deepmerge."""
+        assert reduce_confs([{}, ["a"], ["b"]]) == ["a", "b"]
@@ -51,6 +51,39 @@ class TestEdgeCases:
         shutil.rmtree(relative_tmp_path / "expand_files_list")
         assert result == sorted([str(temp_file_1), str(temp_file_2)])
 
+    def test_expand_files_list_recursive_glob(self, tmp_path):
+        """Test expand files list with a recursive ** pattern."""
+        nested = tmp_path / "configs" / "nested"
+        nested.mkdir(parents=True)
+        temp_file = nested / "config.yml"
+        temp_file.write_text("key: value")
+
+        result = list(expand_files_list(str(tmp_path / "configs") + "/**/*.yml"))
+        assert result == [str(temp_file)]
+
+    def test_expand_files_list_skips_dotfiles(self, tmp_path):
+        """Test expand files list hides dotfiles unless the pattern asks for them."""
+        visible = tmp_path / "config.yml"
+        visible.write_text("key: value")
+        hidden = tmp_path / ".hidden.yml"
+        hidden.write_text("key: value")
+
+        assert list(expand_files_list(str(tmp_path) + "/*.yml")) == [str(visible)]
+        assert list(expand_files_list(str(tmp_path) + "/.*.yml")) == [str(hidden)]
+
+    def test_expand_files_list_follows_symlinks(self, tmp_path):
+        """Test expand files list matches symlinked files like glob does."""
+        target = tmp_path / "target.yml"
+        target.write_text("key: value")
+        link = tmp_path / "link.yml"
+        link.symlink_to(target)
+
+        assert sorted(expand_files_list(str(tmp_path) + "/*.yml")) == [str(link), str(target)]
+
+    def test_expand_files_list_missing_directory(self):
+        """Test expand files list yields nothing for a missing directory."""
+        assert list(expand_files_list("/nonexistent-dir/*.yml")) == []
+
     def test_error_handling_edge_cases(self):
         """Test error handling edge cases to improve coverage."""
         # Test ConfigSchemaValidationError with different message types
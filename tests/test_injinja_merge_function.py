@@ -2,17 +2,18 @@
 
 # Standard Library
 import json
-import textwrap
 from unittest.mock import patch
 
 # Third Party
-import pytest
 import yaml
 from jinja2.filters import FILTERS
 
 # Our Libraries
 from injinja.injinja import get_functions, merge
 
+# Pre-dedented custom function source shared by the functions tests
+LOWERCASE_FILTER_SRC = "def filter_lowercase(value):\n    return value.lower()\n"
+
 
 class TestMergeFunction:
     """Test the main merge function."""
@@ -65,6 +66,17 @@ class TestMergeFunction:
         output = json.loads(captured.out)
         assert output == {"key": "value"}
 
+    def test_merge_config_json_output_non_string_keys(self, tmp_path, capsys):
+        """Test config-json output serializes configs with non-string keys."""
+        config = tmp_path / "config.yml"
+        config.write_text("ports:\n  80: http\n  443: https")
+
+        merge(config=[str(config)], output="config-json")
+
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert output == {"ports": {"80": "http", "443": "https"}}
+
     def test_merge_config_yaml_output(self, tmp_path, capsys):
         """Test merge with config-yaml output."""
         config = tmp_path / "config.json"
@@ -76,22 +88,11 @@ class TestMergeFunction:
         output = yaml.safe_load(captured.out)
         assert output == {"key": "value"}
 
-    @pytest.mark.skip(
-        reason="""
-        Getting inconsistent results across multiple runs. 
-        I suspect due to the nature of setting filters in Jinja is modifying a global function
-    """
-    )
     def test_merge_with_functions(self, tmp_path):
         """Test merge with custom functions."""
         func_file = tmp_path / "merge_with_functions" / "merge_with_functions.py"
         func_file.parent.mkdir(parents=True, exist_ok=True)
-        func_file.write_text(
-            textwrap.dedent("""
-        def filter_lowercase(value):
-            return value.lower()
-        """)
-        )
+        func_file.write_text(LOWERCASE_FILTER_SRC)
 
         # Need non-empty config for Jinja templating environment to be active so that custom functions can be used.
         config = tmp_path / "merge_with_functions" / "merge_with_functions_config.json"
@@ -2,10 +2,10 @@
 
 # Standard Library
 import json
-import textwrap
 
 # Third Party
 import pytest
+from conftest import NAME_AGE_SCHEMA
 
 # Our Libraries
 from injinja.injinja import (
@@ -20,6 +20,25 @@ from injinja.injinja import (
     validate_config_with_schema,
 )
 
+# Pre-dedented model sources so tests avoid repeated textwrap.dedent calls
+NAME_AGE_MODEL_SRC = (
+    "from pydantic import BaseModel\n"
+    "\n"
+    "class TestModel(BaseModel):\n"
+    "    name: str\n"
+    "    age: int\n"
+)
+
+UNIFIED_MODEL_SRC = (
+    "from pydantic import BaseModel\n"
+    "\n"
+    "class UnifiedModel(BaseModel):\n"
+    "    service_name: str\n"
+    "    replicas: int = 1\n"
+)
+
+NAME_ONLY_MODEL_SRC = "from pydantic import BaseModel\n\nclass TestModel(BaseModel):\n    name: str\n"
+
 
 class TestSchemaValidation:
     """Test schema validation functionality."""
@@ -28,15 +47,7 @@ class TestSchemaValidation:
         """Test successful Pydantic model loading."""
         # Create a simple Pydantic model file
         model_file = tmp_path / "test_models.py"
-        model_file.write_text(
-            textwrap.dedent("""
-            from pydantic import BaseModel
-
-            class TestModel(BaseModel):
-                name: str
-                age: int
-        """)
-        )
+        model_file.write_text(NAME_AGE_MODEL_SRC)
 
         # Test loading the model
         model_cls = _load_pydantic_model(f"{model_file}::TestModel")
@@ -70,18 +81,10 @@ class TestSchemaValidation:
         with pytest.raises(SyntaxError):
             _load_pydantic_model(f"{model_file}::TestModel")
 
-    def test_json_schema_loading_success(self, tmp_path):
+    def test_json_schema_loading_success(self, json_schema_file):
         """Test successful JSON schema loading."""
-        schema_file = tmp_path / "test_schema.json"
-        schema_data = {
-            "type": "object",
-            "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
-            "required": ["name", "age"],
-        }
-        schema_file.write_text(json.dumps(schema_data))
-
-        result = _load_json_schema(str(schema_file))
-        assert result == schema_data
+        result = _load_json_schema(str(json_schema_file))
+        assert result == NAME_AGE_SCHEMA
 
     def test_json_schema_loading_missing_file(self):
         """Test JSON schema loading with missing file."""
@@ -107,42 +110,16 @@ class TestSchemaValidation:
             _load_json_schema(str(schema_file))
         assert "JSON Schema must be a .json file" in str(exc_info.value)
 
-    def test_pydantic_validation_success(self, tmp_path):
+    def test_pydantic_validation_success(self, pydantic_model_file):
         """Test successful Pydantic validation."""
-        # Create a Pydantic model
-        model_file = tmp_path / "test_models.py"
-        model_file.write_text(
-            textwrap.dedent("""
-            from pydantic import BaseModel
-
-            class ConfigModel(BaseModel):
-                database_url: str
-                port: int
-                debug: bool = False
-        """)
-        )
-
         # Valid configuration
         config = {"database_url": "postgresql://localhost:5432/test", "port": 8080, "debug": True}
 
         # Should not raise an exception
-        validate_config_with_pydantic(config, f"{model_file}::ConfigModel")
+        validate_config_with_pydantic(config, f"{pydantic_model_file}::ConfigModel")
 
-    def test_pydantic_validation_failure(self, tmp_path):
+    def test_pydantic_validation_failure(self, pydantic_model_file):
         """Test Pydantic validation failure."""
-        # Create a Pydantic model
-        model_file = tmp_path / "test_models.py"
-        model_file.write_text(
-            textwrap.dedent("""
-            from pydantic import BaseModel
-
-            class ConfigModel(BaseModel):
-                database_url: str
-                port: int
-                debug: bool = False
-        """)
-        )
-
         # Invalid configuration (missing required field, wrong type)
         config = {
             "port": "not_an_integer",
@@ -151,7 +128,7 @@ class TestSchemaValidation:
         }
 
         with pytest.raises(ConfigSchemaValidationError) as exc_info:
-            validate_config_with_pydantic(config, f"{model_file}::ConfigModel")
+            validate_config_with_pydantic(config, f"{pydantic_model_file}::ConfigModel")
 
         error_msg = str(exc_info.value)
         assert "Pydantic validation failed" in error_msg
@@ -187,17 +164,8 @@ class TestSchemaValidation:
         # Should not raise an exception
         validate_config_with_jsonschema(config, str(schema_file))
 
-    def test_json_schema_validation_failure(self, tmp_path):
+    def test_json_schema_validation_failure(self, json_schema_file):
         """Test JSON Schema validation failure."""
-        # Create a JSON schema
-        schema_file = tmp_path / "test_schema.json"
-        schema_data = {
-            "type": "object",
-            "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
-            "required": ["name", "age"],
-        }
-        schema_file.write_text(json.dumps(schema_data))
-
         # Invalid configuration
         config = {
             "name": 123,  # Should be string
@@ -206,7 +174,7 @@ class TestSchemaValidation:
         }
 
         with pytest.raises(ConfigSchemaValidationError) as exc_info:
-            validate_config_with_jsonschema(config, str(schema_file))
+            validate_config_with_jsonschema(config, str(json_schema_file))
 
         error_msg = str(exc_info.value)
         assert "Schema validation failed" in error_msg
@@ -215,15 +183,7 @@ class TestSchemaValidation:
         """Test unified schema validation interface with Pydantic."""
         # Create a Pydantic model
         model_file = tmp_path / "test_models.py"
-        model_file.write_text(
-            textwrap.dedent("""
-            from pydantic import BaseModel
-
-            class UnifiedModel(BaseModel):
-                service_name: str
-                replicas: int = 1
-        """)
-        )
+        model_file.write_text(UNIFIED_MODEL_SRC)
 
         config = {"service_name": "api", "replicas": 3}
 
@@ -347,14 +307,7 @@ class TestSchemaValidation:
 
         # Test Pydantic path (with :: in schema)
         model_file = tmp_path / "models.py"
-        model_file.write_text(
-            textwrap.dedent("""
-            from pydantic import BaseModel
-            
-            class TestModel(BaseModel):
-                name: str
-        """)
-        )
+        model_file.write_text(NAME_ONLY_MODEL_SRC)
 
         # This should route to Pydantic validation
         validate_config_with_schema(config, f"{model_file}::TestModel")
@@ -27,6 +27,14 @@ class TestTemplating:
         result = merge_template(str(template_file), {"name": "Test"})
         assert result == "Hello Test"
 
+    def test_merge_template_comment_only(self, tmp_path):
+        """Test merge_template renders templates containing only Jinja comments."""
+        template_file = tmp_path / "template.txt"
+        template_file.write_text("hello {# a comment #}world")
+
+        result = merge_template(str(template_file), {"name": "Test"})
+        assert result == "hello world"
+
     def test_merge_template_undefined_error(self, tmp_path):
         """Test merge_template with undefined variables handles gracefully."""
         template_file = tmp_path / "template.txt"